@@ -2,7 +2,9 @@
 고객 정보 에이전트 - 고객 데이터 관리 및 조회
 포트: 8004
 """
+import heapq
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, HTTPException
@@ -137,96 +139,147 @@ MOCK_CONTRACTS = [
     }
 ]
 
+# 고객 ID → 고객 레코드 색인 (단건 조회를 O(1)로)
+CLIENTS_BY_ID = {client['id']: client for client in MOCK_CLIENTS}
+
+# 고객별 거래/계약 목록 (모듈 로드 시 한 번만 묶어 두고, 응답에는 새 리스트로 복사)
+TRANSACTIONS_BY_CLIENT: Dict[str, List[Dict[str, Any]]] = {}
+for transaction in MOCK_TRANSACTIONS:
+    TRANSACTIONS_BY_CLIENT.setdefault(transaction['client_id'], []).append(transaction)
+
+CONTRACTS_BY_CLIENT: Dict[str, List[Dict[str, Any]]] = {}
+for contract in MOCK_CONTRACTS:
+    CONTRACTS_BY_CLIENT.setdefault(contract['client_id'], []).append(contract)
+
+# 유형/상태별 건수 (모의 데이터는 고정이므로 로드 시 한 번만 집계)
+CLIENT_TYPE_COUNTS = Counter(c['type'] for c in MOCK_CLIENTS)
+CLIENT_STATUS_COUNTS = Counter(c['status'] for c in MOCK_CLIENTS)
+TRANSACTION_STATUS_COUNTS = Counter(t['status'] for t in MOCK_TRANSACTIONS)
+CONTRACT_TYPE_COUNTS = Counter(c['type'] for c in MOCK_CONTRACTS)
+CONTRACT_STATUS_COUNTS = Counter(c['status'] for c in MOCK_CONTRACTS)
+
+
+def _client_transactions(client: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 고객 거래 내역"""
+    transactions = list(TRANSACTIONS_BY_CLIENT.get(client['id'], ()))
+    return {
+        "client_id": client['id'],
+        "name": client['name'],
+        "transactions": transactions,
+        "total_transactions": len(transactions),
+        "total_amount": sum(t['amount'] for t in transactions)
+    }
+
+
+def _client_contracts(client: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 고객 계약 현황"""
+    contracts = list(CONTRACTS_BY_CLIENT.get(client['id'], ()))
+    return {
+        "client_id": client['id'],
+        "name": client['name'],
+        "contracts": contracts,
+        "total_contracts": len(contracts),
+        "total_contract_value": sum(c['value'] for c in contracts)
+    }
+
+
+def _client_basic(client: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 고객 기본 정보"""
+    return {
+        "client_id": client['id'],
+        "name": client['name'],
+        "type": client['type'],
+        "contact": client['contact'],
+        "address": client['address'],
+        "registration_date": client['registration_date'],
+        "total_transactions": client['total_transactions'],
+        "total_amount": client['total_amount'],
+        "status": client['status']
+    }
+
+
+def _summary_transactions() -> Dict[str, Any]:
+    """전체 거래 요약"""
+    return {
+        "total_clients": len(MOCK_CLIENTS),
+        "total_transactions": len(MOCK_TRANSACTIONS),
+        "total_amount": sum(t['amount'] for t in MOCK_TRANSACTIONS),
+        "recent_transactions": heapq.nlargest(5, MOCK_TRANSACTIONS, key=lambda x: x['date']),
+        "transaction_status": {
+            "completed": TRANSACTION_STATUS_COUNTS['completed'],
+            "pending": TRANSACTION_STATUS_COUNTS['pending']
+        }
+    }
+
+
+def _summary_contracts() -> Dict[str, Any]:
+    """전체 계약 요약"""
+    return {
+        "total_clients": len(MOCK_CLIENTS),
+        "total_contracts": len(MOCK_CONTRACTS),
+        "total_contract_value": sum(c['value'] for c in MOCK_CONTRACTS),
+        "active_contracts": CONTRACT_STATUS_COUNTS['active'],
+        "contract_types": {
+            "supply_agreement": CONTRACT_TYPE_COUNTS['supply_agreement'],
+            "distribution_agreement": CONTRACT_TYPE_COUNTS['distribution_agreement']
+        }
+    }
+
+
+def _summary_basic() -> Dict[str, Any]:
+    """전체 고객 기본 요약"""
+    return {
+        "total_clients": len(MOCK_CLIENTS),
+        "client_types": {
+            "hospital": CLIENT_TYPE_COUNTS['hospital'],
+            "clinic": CLIENT_TYPE_COUNTS['clinic'],
+            "pharmacy": CLIENT_TYPE_COUNTS['pharmacy']
+        },
+        "client_status": {
+            "active": CLIENT_STATUS_COUNTS['active'],
+            "new": CLIENT_STATUS_COUNTS['new']
+        },
+        "total_business_value": sum(c['total_amount'] for c in MOCK_CLIENTS)
+    }
+
+
+# 조회 유형 → 처리 함수 (알 수 없는 유형은 basic으로 처리)
+CLIENT_INFO_HANDLERS = {
+    "transactions": _client_transactions,
+    "contracts": _client_contracts,
+    "basic": _client_basic
+}
+
+SUMMARY_INFO_HANDLERS = {
+    "transactions": _summary_transactions,
+    "contracts": _summary_contracts,
+    "basic": _summary_basic
+}
+
 
 def get_client_info(client_id: Optional[str] = None, info_type: str = "basic") -> Dict[str, Any]:
     """고객 정보 조회 함수"""
     
     if client_id:
         # 특정 고객 정보
-        client = next((cli for cli in MOCK_CLIENTS if cli['id'] == client_id), None)
+        client = CLIENTS_BY_ID.get(client_id)
         if not client:
             return {"error": f"Client {client_id} not found"}
         
-        if info_type == "transactions":
-            transactions = [t for t in MOCK_TRANSACTIONS if t['client_id'] == client_id]
-            return {
-                "client_id": client_id,
-                "name": client['name'],
-                "transactions": transactions,
-                "total_transactions": len(transactions),
-                "total_amount": sum(t['amount'] for t in transactions)
-            }
-        
-        elif info_type == "contracts":
-            contracts = [c for c in MOCK_CONTRACTS if c['client_id'] == client_id]
-            return {
-                "client_id": client_id,
-                "name": client['name'],
-                "contracts": contracts,
-                "total_contracts": len(contracts),
-                "total_contract_value": sum(c['value'] for c in contracts)
-            }
-        
-        else:  # basic
-            return {
-                "client_id": client_id,
-                "name": client['name'],
-                "type": client['type'],
-                "contact": client['contact'],
-                "address": client['address'],
-                "registration_date": client['registration_date'],
-                "total_transactions": client['total_transactions'],
-                "total_amount": client['total_amount'],
-                "status": client['status']
-            }
+        handler = CLIENT_INFO_HANDLERS.get(info_type, _client_basic)
+        return handler(client)
     
     else:
         # 전체 고객 정보
-        if info_type == "transactions":
-            return {
-                "total_clients": len(MOCK_CLIENTS),
-                "total_transactions": len(MOCK_TRANSACTIONS),
-                "total_amount": sum(t['amount'] for t in MOCK_TRANSACTIONS),
-                "recent_transactions": sorted(MOCK_TRANSACTIONS, key=lambda x: x['date'], reverse=True)[:5],
-                "transaction_status": {
-                    "completed": len([t for t in MOCK_TRANSACTIONS if t['status'] == 'completed']),
-                    "pending": len([t for t in MOCK_TRANSACTIONS if t['status'] == 'pending'])
-                }
-            }
-        
-        elif info_type == "contracts":
-            return {
-                "total_clients": len(MOCK_CLIENTS),
-                "total_contracts": len(MOCK_CONTRACTS),
-                "total_contract_value": sum(c['value'] for c in MOCK_CONTRACTS),
-                "active_contracts": len([c for c in MOCK_CONTRACTS if c['status'] == 'active']),
-                "contract_types": {
-                    "supply_agreement": len([c for c in MOCK_CONTRACTS if c['type'] == 'supply_agreement']),
-                    "distribution_agreement": len([c for c in MOCK_CONTRACTS if c['type'] == 'distribution_agreement'])
-                }
-            }
-        
-        else:  # basic
-            return {
-                "total_clients": len(MOCK_CLIENTS),
-                "client_types": {
-                    "hospital": len([c for c in MOCK_CLIENTS if c['type'] == 'hospital']),
-                    "clinic": len([c for c in MOCK_CLIENTS if c['type'] == 'clinic']),
-                    "pharmacy": len([c for c in MOCK_CLIENTS if c['type'] == 'pharmacy'])
-                },
-                "client_status": {
-                    "active": len([c for c in MOCK_CLIENTS if c['status'] == 'active']),
-                    "new": len([c for c in MOCK_CLIENTS if c['status'] == 'new'])
-                },
-                "total_business_value": sum(c['total_amount'] for c in MOCK_CLIENTS)
-            }
+        handler = SUMMARY_INFO_HANDLERS.get(info_type, _summary_basic)
+        return handler()
 
 
 @app.post("/info", response_model=ClientInfoResponse)
 async def get_client_information(request: ClientInfoRequest):
     """고객 정보 조회"""
     try:
-        logger.info(f"Getting client info: {request.client_id}, type: {request.info_type}")
+        logger.info("Getting client info: %s, type: %s", request.client_id, request.info_type)
         
         # 고객 정보 조회
         results = get_client_info(request.client_id, request.info_type)
@@ -238,7 +291,7 @@ async def get_client_information(request: ClientInfoRequest):
             client_count=len(MOCK_CLIENTS)
         )
         
-        logger.info(f"Client info retrieved for {request.info_type}")
+        logger.info("Client info retrieved for %s", request.info_type)
         return response
         
     except Exception as e:
@@ -2,9 +2,11 @@
 문서 검색 에이전트 - 문서 검색 및 임베딩 처리
 포트: 8002
 """
+import heapq
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import uvicorn
@@ -71,43 +73,56 @@ MOCK_DOCUMENTS = [
     }
 ]
 
+# 문서별 소문자 정규화 제목/본문 (모듈 로드 시 한 번만 계산)
+NORMALIZED_DOCUMENTS = tuple(
+    (doc, doc['title'].lower(), doc['content'].lower()) for doc in MOCK_DOCUMENTS
+)
+
 
 def search_documents(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
-    """문서 검색 함수"""
-    query_lower = query.lower()
+    """문서 검색 함수 (정규화된 질의 기준으로 결과 캐시, 호출자에게는 사본 반환)"""
+    return [dict(result) for result in _search_documents_cached(query.lower(), top_k)]
+
+
+@lru_cache(maxsize=1024)
+def _search_documents_cached(query_lower: str, top_k: int) -> Tuple[Dict[str, Any], ...]:
+    """문서 검색 본체 - 문서 집합이 고정이므로 동일 질의는 재계산하지 않음"""
+    # 질의 토큰은 문서마다 다시 나누지 않고 한 번만 생성
+    query_tokens = query_lower.split()
     
     # 간단한 키워드 매칭 (실제로는 벡터 유사도 검색)
     results = []
-    for doc in MOCK_DOCUMENTS:
+    for doc, title_lower, content_lower in NORMALIZED_DOCUMENTS:
         score = 0.0
         
         # 제목에서 키워드 검색
-        if any(keyword in doc['title'].lower() for keyword in query_lower.split()):
+        if any(keyword in title_lower for keyword in query_tokens):
             score += 0.3
         
         # 내용에서 키워드 검색
-        if any(keyword in doc['content'].lower() for keyword in query_lower.split()):
+        if any(keyword in content_lower for keyword in query_tokens):
             score += 0.2
         
         # 기본 관련성 점수
         score += doc['relevance'] * 0.5
         
         if score > 0:
-            result = doc.copy()
-            result['score'] = score
-            results.append(result)
+            results.append({**doc, 'score': score})
     
-    # 점수 기준으로 정렬
-    results.sort(key=lambda x: x['score'], reverse=True)
+    # 점수 기준 상위 top_k개만 선택 (전체 정렬 불필요)
+    if top_k >= 0:
+        return tuple(heapq.nlargest(top_k, results, key=lambda x: x['score']))
     
-    return results[:top_k]
+    # 음수 top_k는 기존 슬라이스 동작 유지 (하위 |top_k|개 제외)
+    results.sort(key=lambda x: x['score'], reverse=True)
+    return tuple(results[:top_k])
 
 
 @app.post("/search", response_model=SearchResponse)
 async def search(request: SearchRequest):
     """문서 검색"""
     try:
-        logger.info(f"Searching documents for: {request.query}")
+        logger.info("Searching documents for: %s", request.query)
         
         start_time = datetime.now()
         
@@ -123,7 +138,7 @@ async def search(request: SearchRequest):
             timestamp=datetime.now().isoformat()
         )
         
-        logger.info(f"Search completed: {len(results)} results found")
+        logger.info("Search completed: %d results found", len(results))
         return response
         
     except Exception as e:
@@ -2,7 +2,9 @@
 직원 분석 에이전트 - 직원 데이터 분석 및 통계
 포트: 8003
 """
+import bisect
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, HTTPException
@@ -79,6 +81,132 @@ MOCK_EMPLOYEES = [
     }
 ]
 
+# 직원 ID → 직원 레코드 색인 (단건 조회를 O(1)로)
+EMPLOYEES_BY_ID = {employee['id']: employee for employee in MOCK_EMPLOYEES}
+
+# 등급 구간 경계 (오름차순) 및 구간별 등급
+PERFORMANCE_GRADE_CUTS = (80, 90)
+ATTENDANCE_GRADE_CUTS = (0.90, 0.95)
+GRADE_LABELS = ("C", "B", "A")
+
+
+def get_grade(value: float, cuts: tuple) -> str:
+    """경계값 이상이면 상위 등급이 되도록 이진 탐색으로 등급 결정"""
+    return GRADE_LABELS[bisect.bisect_right(cuts, value)]
+
+
+def _employee_performance(employee: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 직원 성과 분석"""
+    return {
+        "employee_id": employee['id'],
+        "name": employee['name'],
+        "performance_score": employee['performance_score'],
+        "performance_grade": get_grade(employee['performance_score'], PERFORMANCE_GRADE_CUTS),
+        "recommendation": "우수한 성과를 보이고 있습니다." if employee['performance_score'] >= 80 else "개선이 필요합니다."
+    }
+
+
+def _employee_attendance(employee: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 직원 출근 분석"""
+    return {
+        "employee_id": employee['id'],
+        "name": employee['name'],
+        "attendance_rate": employee['attendance_rate'],
+        "attendance_grade": get_grade(employee['attendance_rate'], ATTENDANCE_GRADE_CUTS),
+        "status": "양호" if employee['attendance_rate'] >= 0.90 else "주의 필요"
+    }
+
+
+def _employee_general(employee: Dict[str, Any]) -> Dict[str, Any]:
+    """특정 직원 기본 분석"""
+    return {
+        "employee_id": employee['id'],
+        "name": employee['name'],
+        "department": employee['department'],
+        "position": employee['position'],
+        "join_date": employee['join_date'],
+        "overall_score": (employee['performance_score'] + employee['attendance_rate'] * 100) / 2,
+        "status": "우수 직원"
+    }
+
+
+def _overall_performance() -> Dict[str, Any]:
+    """전체 직원 성과 분석"""
+    # 합계와 등급 분포를 한 번의 순회로 집계
+    total_performance = 0
+    grade_counts = Counter()
+    for emp in MOCK_EMPLOYEES:
+        total_performance += emp['performance_score']
+        grade_counts[get_grade(emp['performance_score'], PERFORMANCE_GRADE_CUTS)] += 1
+    avg_performance = total_performance / len(MOCK_EMPLOYEES)
+    
+    return {
+        "total_employees": len(MOCK_EMPLOYEES),
+        "average_performance": round(avg_performance, 2),
+        "top_performers": grade_counts["A"],
+        "performance_distribution": {
+            "A등급 (90+)": grade_counts["A"],
+            "B등급 (80-89)": grade_counts["B"],
+            "C등급 (70-79)": grade_counts["C"]
+        }
+    }
+
+
+def _overall_attendance() -> Dict[str, Any]:
+    """전체 직원 출근 분석"""
+    # 합계와 등급 분포를 한 번의 순회로 집계
+    total_attendance = 0.0
+    grade_counts = Counter()
+    for emp in MOCK_EMPLOYEES:
+        total_attendance += emp['attendance_rate']
+        grade_counts[get_grade(emp['attendance_rate'], ATTENDANCE_GRADE_CUTS)] += 1
+    avg_attendance = total_attendance / len(MOCK_EMPLOYEES)
+    
+    return {
+        "total_employees": len(MOCK_EMPLOYEES),
+        "average_attendance": round(avg_attendance, 3),
+        "excellent_attendance": grade_counts["A"],
+        "attendance_distribution": {
+            "우수 (95%+)": grade_counts["A"],
+            "양호 (90-94%)": grade_counts["B"],
+            "개선 필요 (90% 미만)": grade_counts["C"]
+        }
+    }
+
+
+def _overall_general() -> Dict[str, Any]:
+    """전체 직원 기본 분석"""
+    # 부서별 인원과 성과/출근 합계를 한 번의 순회로 집계
+    total_performance = 0
+    total_attendance = 0.0
+    department_counts = Counter()
+    for emp in MOCK_EMPLOYEES:
+        total_performance += emp['performance_score']
+        total_attendance += emp['attendance_rate']
+        department_counts[emp['department']] += 1
+    
+    return {
+        "total_employees": len(MOCK_EMPLOYEES),
+        "departments": list(department_counts),
+        "average_performance": round(total_performance / len(MOCK_EMPLOYEES), 2),
+        "average_attendance": round(total_attendance / len(MOCK_EMPLOYEES), 3),
+        "department_distribution": dict(department_counts)
+    }
+
+
+# 분석 유형 → 처리 함수 (알 수 없는 유형은 general로 처리)
+EMPLOYEE_ANALYSIS_HANDLERS = {
+    "performance": _employee_performance,
+    "attendance": _employee_attendance,
+    "general": _employee_general
+}
+
+OVERALL_ANALYSIS_HANDLERS = {
+    "performance": _overall_performance,
+    "attendance": _overall_attendance,
+    "general": _overall_general
+}
+
 
 def analyze_employee_data(employee_id: Optional[str] = None, 
                          analysis_type: str = "general") -> Dict[str, Any]:
@@ -86,89 +214,29 @@ def analyze_employee_data(employee_id: Optional[str] = None,
     
     if employee_id:
         # 특정 직원 분석
-        employee = next((emp for emp in MOCK_EMPLOYEES if emp['id'] == employee_id), None)
+        employee = EMPLOYEES_BY_ID.get(employee_id)
         if not employee:
             return {"error": f"Employee {employee_id} not found"}
         
-        if analysis_type == "performance":
-            return {
-                "employee_id": employee_id,
-                "name": employee['name'],
-                "performance_score": employee['performance_score'],
-                "performance_grade": "A" if employee['performance_score'] >= 90 else "B" if employee['performance_score'] >= 80 else "C",
-                "recommendation": "우수한 성과를 보이고 있습니다." if employee['performance_score'] >= 80 else "개선이 필요합니다."
-            }
-        
-        elif analysis_type == "attendance":
-            return {
-                "employee_id": employee_id,
-                "name": employee['name'],
-                "attendance_rate": employee['attendance_rate'],
-                "attendance_grade": "A" if employee['attendance_rate'] >= 0.95 else "B" if employee['attendance_rate'] >= 0.90 else "C",
-                "status": "양호" if employee['attendance_rate'] >= 0.90 else "주의 필요"
-            }
-        
-        else:  # general
-            return {
-                "employee_id": employee_id,
-                "name": employee['name'],
-                "department": employee['department'],
-                "position": employee['position'],
-                "join_date": employee['join_date'],
-                "overall_score": (employee['performance_score'] + employee['attendance_rate'] * 100) / 2,
-                "status": "우수 직원"
-            }
+        handler = EMPLOYEE_ANALYSIS_HANDLERS.get(analysis_type, _employee_general)
+        return handler(employee)
     
     else:
         # 전체 직원 분석
-        if analysis_type == "performance":
-            avg_performance = sum(emp['performance_score'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES)
-            top_performers = [emp for emp in MOCK_EMPLOYEES if emp['performance_score'] >= 90]
-            
-            return {
-                "total_employees": len(MOCK_EMPLOYEES),
-                "average_performance": round(avg_performance, 2),
-                "top_performers": len(top_performers),
-                "performance_distribution": {
-                    "A등급 (90+)": len([emp for emp in MOCK_EMPLOYEES if emp['performance_score'] >= 90]),
-                    "B등급 (80-89)": len([emp for emp in MOCK_EMPLOYEES if 80 <= emp['performance_score'] < 90]),
-                    "C등급 (70-79)": len([emp for emp in MOCK_EMPLOYEES if emp['performance_score'] < 80])
-                }
-            }
-        
-        elif analysis_type == "attendance":
-            avg_attendance = sum(emp['attendance_rate'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES)
-            excellent_attendance = [emp for emp in MOCK_EMPLOYEES if emp['attendance_rate'] >= 0.95]
-            
-            return {
-                "total_employees": len(MOCK_EMPLOYEES),
-                "average_attendance": round(avg_attendance, 3),
-                "excellent_attendance": len(excellent_attendance),
-                "attendance_distribution": {
-                    "우수 (95%+)": len([emp for emp in MOCK_EMPLOYEES if emp['attendance_rate'] >= 0.95]),
-                    "양호 (90-94%)": len([emp for emp in MOCK_EMPLOYEES if 0.90 <= emp['attendance_rate'] < 0.95]),
-                    "개선 필요 (90% 미만)": len([emp for emp in MOCK_EMPLOYEES if emp['attendance_rate'] < 0.90])
-                }
-            }
-        
-        else:  # general
-            return {
-                "total_employees": len(MOCK_EMPLOYEES),
-                "departments": list(set(emp['department'] for emp in MOCK_EMPLOYEES)),
-                "average_performance": round(sum(emp['performance_score'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES), 2),
-                "average_attendance": round(sum(emp['attendance_rate'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES), 3),
-                "department_distribution": {
-                    dept: len([emp for emp in MOCK_EMPLOYEES if emp['department'] == dept])
-                    for dept in set(emp['department'] for emp in MOCK_EMPLOYEES)
-                }
-            }
+        return _analyze_all_employees(analysis_type)
+
+
+def _analyze_all_employees(analysis_type: str) -> Dict[str, Any]:
+    """전체 직원 분석 (알 수 없는 유형은 general로 처리)"""
+    handler = OVERALL_ANALYSIS_HANDLERS.get(analysis_type, _overall_general)
+    return handler()
 
 
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_employee(request: AnalyzeRequest):
     """직원 분석"""
     try:
-        logger.info(f"Analyzing employee data: {request.employee_id}, type: {request.analysis_type}")
+        logger.info("Analyzing employee data: %s, type: %s", request.employee_id, request.analysis_type)
         
         # 직원 분석
         results = analyze_employee_data(request.employee_id, request.analysis_type)
@@ -180,7 +248,7 @@ async def analyze_employee(request: AnalyzeRequest):
             employee_count=len(MOCK_EMPLOYEES)
         )
         
-        logger.info(f"Analysis completed for {request.analysis_type}")
+        logger.info("Analysis completed for %s", request.analysis_type)
         return response
         
     except Exception as e:
@@ -200,12 +268,13 @@ async def list_employees():
 
 @app.get("/stats")
 async def get_stats():
-    """통계 조회"""
+    """통계 조회 (전체 직원 기본 분석의 단일 순회 집계 재사용)"""
+    summary = _overall_general()
     return {
-        "total_employees": len(MOCK_EMPLOYEES),
-        "departments": list(set(emp['department'] for emp in MOCK_EMPLOYEES)),
-        "average_performance": round(sum(emp['performance_score'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES), 2),
-        "average_attendance": round(sum(emp['attendance_rate'] for emp in MOCK_EMPLOYEES) / len(MOCK_EMPLOYEES), 3),
+        "total_employees": summary['total_employees'],
+        "departments": summary['departments'],
+        "average_performance": summary['average_performance'],
+        "average_attendance": summary['average_attendance'],
         "timestamp": datetime.now().isoformat()
     }
 
@@ -3,7 +3,10 @@
 포트: 8005
 """
 import logging
+import random
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -69,25 +72,59 @@ CHAT_RESPONSES = {
 }
 
 
+# 카테고리 목록과 전체 응답 수 (고정값이므로 로드 시 한 번만 계산)
+CHAT_CATEGORIES = list(CHAT_RESPONSES)
+TOTAL_CHAT_RESPONSES = sum(len(responses) for responses in CHAT_RESPONSES.values())
+
+# 카테고리별 분류 키워드 (우선순위 순서)
+CATEGORY_KEYWORDS = {
+    "인사": ['안녕', '하이', '반갑', '처음', '시작'],
+    "감사": ['감사', '고마워', '좋아', '훌륭', '잘'],
+    "회사": ['회사', '좋은제약', '제약회사', '기업'],
+    "업무": ['업무', '일', '작업', '프로젝트']
+}
+
+# 키워드 → (우선순위, 카테고리) 역색인
+KEYWORD_CATEGORY = {
+    keyword: (rank, category)
+    for rank, (category, keywords) in enumerate(CATEGORY_KEYWORDS.items())
+    for keyword in keywords
+}
+
+# 전체 키워드를 우선순위 순서로 묶은 단일 정규식 (전방탐색으로 겹치는 위치도 모두 검사)
+CATEGORY_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in KEYWORD_CATEGORY) + "))"
+)
+
+# 카테고리 설명 (고정값이므로 요청마다 다시 만들지 않음)
+CATEGORY_DESCRIPTIONS = {
+    "인사": "인사말 및 시작 대화",
+    "감사": "감사 표현 및 긍정적 피드백",
+    "회사": "회사 관련 일반적인 질문",
+    "업무": "업무 관련 일반적인 안내",
+    "기본": "기타 일반적인 대화"
+}
+
+
+@lru_cache(maxsize=1024)
 def classify_message(message: str) -> str:
-    """메시지 분류 함수"""
-    message_lower = message.lower()
-    
-    if any(keyword in message_lower for keyword in ['안녕', '하이', '반갑', '처음', '시작']):
-        return "인사"
-    elif any(keyword in message_lower for keyword in ['감사', '고마워', '좋아', '훌륭', '잘']):
-        return "감사"
-    elif any(keyword in message_lower for keyword in ['회사', '좋은제약', '제약회사', '기업']):
-        return "회사"
-    elif any(keyword in message_lower for keyword in ['업무', '일', '작업', '프로젝트']):
-        return "업무"
-    else:
-        return "기본"
-
-
-def generate_response(message: str, context: Optional[Dict[str, Any]] = None) -> str:
-    """응답 생성 함수"""
-    category = classify_message(message)
+    """메시지 분류 함수 (반복되는 메시지는 캐시된 분류 재사용)"""
+    # 메시지를 한 번만 훑으며 가장 우선순위가 높은 카테고리를 선택
+    best = None
+    for match in CATEGORY_PATTERN.finditer(message.lower()):
+        candidate = KEYWORD_CATEGORY[match.group(1)]
+        if best is None or candidate < best:
+            best = candidate
+            if best[0] == 0:
+                break
+    return best[1] if best else "기본"
+
+
+def generate_response(message: str, context: Optional[Dict[str, Any]] = None,
+                      category: Optional[str] = None) -> str:
+    """응답 생성 함수 (이미 분류된 카테고리가 있으면 재사용)"""
+    if category is None:
+        category = classify_message(message)
     
     # 컨텍스트 기반 응답 조정
     if context and context.get('previous_category'):
@@ -98,7 +135,6 @@ def generate_response(message: str, context: Optional[Dict[str, Any]] = None) ->
     responses = CHAT_RESPONSES.get(category, CHAT_RESPONSES["기본"])
     
     # 간단한 로테이션 (실제로는 더 복잡한 로직 사용)
-    import random
     return random.choice(responses)
 
 
@@ -106,18 +142,21 @@ def generate_response(message: str, context: Optional[Dict[str, Any]] = None) ->
 async def chat(request: ChatRequest):
     """일반 대화 처리"""
     try:
-        logger.info(f"Processing chat message: {request.message}")
+        logger.info("Processing chat message: %s", request.message)
         
         # 대화 ID 생성 (없으면 새로 생성)
         conversation_id = request.conversation_id or f"conv_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
+        # 메시지 분류는 요청당 한 번만 수행
+        category = classify_message(request.message)
+        
         # 응답 생성
-        response_text = generate_response(request.message, request.context)
+        response_text = generate_response(request.message, request.context, category)
         
         # 새로운 컨텍스트 생성
         new_context = {
             "previous_message": request.message,
-            "previous_category": classify_message(request.message),
+            "previous_category": category,
             "conversation_length": (request.context.get('conversation_length', 0) + 1) if request.context else 1
         }
         
@@ -128,7 +167,7 @@ async def chat(request: ChatRequest):
             timestamp=datetime.now().isoformat()
         )
         
-        logger.info(f"Chat response generated: {response.response[:50]}...")
+        logger.info("Chat response generated: %.50s...", response.response)
         return response
         
     except Exception as e:
@@ -161,14 +200,8 @@ async def get_conversation(conversation_id: str):
 async def get_categories():
     """대화 카테고리 조회"""
     return {
-        "categories": list(CHAT_RESPONSES.keys()),
-        "descriptions": {
-            "인사": "인사말 및 시작 대화",
-            "감사": "감사 표현 및 긍정적 피드백",
-            "회사": "회사 관련 일반적인 질문",
-            "업무": "업무 관련 일반적인 안내",
-            "기본": "기타 일반적인 대화"
-        },
+        "categories": CHAT_CATEGORIES,
+        "descriptions": CATEGORY_DESCRIPTIONS,
         "timestamp": datetime.now().isoformat()
     }
 
@@ -178,7 +211,7 @@ async def get_stats():
     """통계 조회"""
     return {
         "total_categories": len(CHAT_RESPONSES),
-        "total_responses": sum(len(responses) for responses in CHAT_RESPONSES.values()),
+        "total_responses": TOTAL_CHAT_RESPONSES,
         "capabilities": ["general_chat", "context_awareness", "conversation_tracking"],
         "timestamp": datetime.now().isoformat()
     }
@@ -2,11 +2,15 @@
 고도화된 라우터 에이전트 - OpenAI GPT-4o 기반 지능형 라우팅
 포트: 8001
 """
+import asyncio
 import logging
 import os
+import re
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import uvicorn
@@ -174,6 +178,78 @@ AGENT_TOOLS = [
     }
 ]
 
+# 폴백 라우팅 / 신뢰도 계산용 키워드 (모듈 로드 시 한 번만 생성)
+AGENT_KEYWORDS = {
+    "search_documents": frozenset(['문서', '정책', '규정', '윤리', '강령', '복리후생']),
+    "analyze_employee_data": frozenset(['직원', '사원', '성과', '출근', '부서']),
+    "get_client_information": frozenset(['고객', '거래처', '매출', '계약']),
+    "general_conversation": frozenset(['안녕', '반갑', '좋은', '회사'])
+}
+
+# 키워드 → 에이전트 역색인과 전체 키워드를 한 번에 훑는 정규식
+# (전방탐색으로 겹치는 위치도 모두 검사하고, 같은 위치에서는 긴 키워드 우선)
+KEYWORD_TO_AGENT = {
+    keyword: function_name
+    for function_name, keywords in AGENT_KEYWORDS.items()
+    for keyword in keywords
+}
+KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in sorted(KEYWORD_TO_AGENT, key=len, reverse=True)) + "))"
+)
+
+# 키워드 → 그 안에 포함된 키워드 전체 (긴 키워드에 가려진 짧은 키워드도 집계)
+KEYWORD_SUBSTRINGS = {
+    keyword: tuple(other for other in KEYWORD_TO_AGENT if other in keyword)
+    for keyword in KEYWORD_TO_AGENT
+}
+
+
+@lru_cache(maxsize=2048)
+def scan_keywords(message_lower: str) -> Mapping[str, frozenset]:
+    """소문자 메시지를 한 번만 훑어 에이전트별 매칭 키워드 집합 반환 (반복 메시지는 캐시, 읽기 전용)"""
+    hits: Dict[str, set] = {}
+    for match in KEYWORD_PATTERN.finditer(message_lower):
+        for keyword in KEYWORD_SUBSTRINGS[match.group(1)]:
+            hits.setdefault(KEYWORD_TO_AGENT[keyword], set()).add(keyword)
+    return MappingProxyType({function_name: frozenset(keywords) for function_name, keywords in hits.items()})
+
+
+# 함수 이름 → 서비스 이름 매핑
+FUNCTION_TO_SERVICE = {
+    "search_documents": "document_agent",
+    "analyze_employee_data": "employee_agent",
+    "get_client_information": "client_agent",
+    "general_conversation": "general_agent"
+}
+
+
+# 라우터 시스템 프롬프트 (요청마다 다시 만들지 않고, 들여쓰기 공백을 빼 토큰을 줄임;
+# 고정 접두부라 OpenAI 프롬프트 캐시에 재사용됨)
+ROUTER_SYSTEM_PROMPT = """\
+당신은 좋은제약 AI 어시스턴트의 지능형 라우터입니다.
+사용자의 질문을 정확히 분석하여 가장 적절한 전문 에이전트에게 라우팅해야 합니다.
+
+4개의 전문 에이전트와 역할:
+
+1. **문서검색 에이전트** (search_documents)
+   - 회사 정책, 규정, 윤리강령, 행동강령, 복리후생 등 내부 문서 검색
+   - 키워드: 문서, 정책, 규정, 윤리, 강령, 복리후생, 자료, 찾아줘
+
+2. **직원분석 에이전트** (analyze_employee_data)
+   - 직원 정보, 성과 분석, 출근 현황, 부서 통계, 인사 데이터
+   - 키워드: 직원, 사원, 성과, 출근, 부서, 통계, 분석, 인사
+
+3. **고객정보 에이전트** (get_client_information)
+   - 고객사 정보, 거래 내역, 계약 현황, 매출 분석, 영업 데이터
+   - 키워드: 고객, 거래처, 클라이언트, 매출, 계약, 거래, 영업
+
+4. **일반대화 에이전트** (general_conversation)
+   - 인사말, 일반 질문, 회사 소개, 기타 대화
+   - 위 3개 영역에 해당하지 않는 모든 대화
+
+사용자 질문을 분석하여 가장 적합한 function을 호출하고,
+적절한 parameters를 설정하세요.
+"""
 
 
 class EnhancedRouterAgent:
@@ -186,12 +262,34 @@ class EnhancedRouterAgent:
             logger.warning("OPENAI_API_KEY not found. Using fallback routing.")
             self.openai_client = None
         else:
-            self.openai_client = openai.OpenAI(api_key=api_key)
+            # 단일 비동기 클라이언트를 재사용해 커넥션(TLS 포함)을 유지
+            self.openai_client = openai.AsyncOpenAI(
+                api_key=api_key,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=60
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=10.0)
+                )
+            )
             logger.info("OpenAI 클라이언트 초기화 완료")
         
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4o')
         self.tools = AGENT_TOOLS
         
+        # 동시 세션의 OpenAI 호출 수 제한 (레이트 리밋 보호, 잘못된 값이면 기본값 사용)
+        try:
+            self.max_concurrent_requests = int(os.getenv('OPENAI_MAX_CONCURRENCY', '10'))
+        except ValueError:
+            self.max_concurrent_requests = 0
+        if self.max_concurrent_requests < 1:
+            logger.warning("OPENAI_MAX_CONCURRENCY 값이 올바르지 않아 기본값 10을 사용합니다.")
+            self.max_concurrent_requests = 10
+        # 세마포어는 서버 이벤트 루프 안에서 처음 사용할 때 생성 (Python 3.8/3.9는 생성 시점 루프에 묶임)
+        self._openai_semaphore: Optional[asyncio.Semaphore] = None
+        
         # 서비스 URL 매핑
         self.service_urls = {
             "search_documents": "http://localhost:8002",
@@ -208,36 +306,9 @@ class EnhancedRouterAgent:
             return self._fallback_routing(user_message)
         
         try:
-            # 시스템 프롬프트 구성
-            system_prompt = """
-            당신은 좋은제약 AI 어시스턴트의 지능형 라우터입니다. 
-            사용자의 질문을 정확히 분석하여 가장 적절한 전문 에이전트에게 라우팅해야 합니다.
-
-            4개의 전문 에이전트와 역할:
-            
-            1. **문서검색 에이전트** (search_documents)
-               - 회사 정책, 규정, 윤리강령, 행동강령, 복리후생 등 내부 문서 검색
-               - 키워드: 문서, 정책, 규정, 윤리, 강령, 복리후생, 자료, 찾아줘
-            
-            2. **직원분석 에이전트** (analyze_employee_data)  
-               - 직원 정보, 성과 분석, 출근 현황, 부서 통계, 인사 데이터
-               - 키워드: 직원, 사원, 성과, 출근, 부서, 통계, 분석, 인사
-               
-            3. **고객정보 에이전트** (get_client_information)
-               - 고객사 정보, 거래 내역, 계약 현황, 매출 분석, 영업 데이터
-               - 키워드: 고객, 거래처, 클라이언트, 매출, 계약, 거래, 영업
-               
-            4. **일반대화 에이전트** (general_conversation)
-               - 인사말, 일반 질문, 회사 소개, 기타 대화
-               - 위 3개 영역에 해당하지 않는 모든 대화
-
-            사용자 질문을 분석하여 가장 적합한 function을 호출하고, 
-            적절한 parameters를 설정하세요.
-            """
-            
-            # 대화 맥락 포함
+            # 대화 맥락 포함 (시스템 프롬프트는 모듈 상수 재사용)
             messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": ROUTER_SYSTEM_PROMPT},
                 {"role": "user", "content": user_message}
             ]
             
@@ -245,14 +316,17 @@ class EnhancedRouterAgent:
             if context and context.get('previous_messages'):
                 messages = context['previous_messages'] + messages[-1:]
             
-            # OpenAI API 호출
-            response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=self.tools,
-                tool_choice="auto",
-                temperature=0.1  # 일관성을 위해 낮은 temperature
-            )
+            # OpenAI API 호출 (동시 세션끼리 네트워크 대기를 겹치게 함)
+            if self._openai_semaphore is None:
+                self._openai_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            async with self._openai_semaphore:
+                response = await self.openai_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    tools=self.tools,
+                    tool_choice="auto",
+                    temperature=0.1  # 일관성을 위해 낮은 temperature
+                )
             
             # 응답 처리
             message = response.choices[0].message
@@ -294,12 +368,16 @@ class EnhancedRouterAgent:
             logger.error(f"OpenAI API 호출 실패: {str(e)}")
             return self._fallback_routing(user_message)
     
+    def _scan_keywords(self, message: str) -> Mapping[str, frozenset]:
+        """메시지를 한 번만 훑어 에이전트별 매칭 키워드 집합 반환"""
+        return scan_keywords(message.lower().strip())
+    
     def _fallback_routing(self, message: str) -> Dict[str, Any]:
         """OpenAI API 사용 불가시 폴백 라우팅"""
-        message_lower = message.lower()
+        hits = self._scan_keywords(message)
         
         # 간단한 키워드 기반 분류
-        if any(keyword in message_lower for keyword in ['문서', '정책', '규정', '윤리', '강령', '복리후생']):
+        if "search_documents" in hits:
             return {
                 "intent": "search_documents",
                 "confidence": 0.7,
@@ -310,7 +388,7 @@ class EnhancedRouterAgent:
                 },
                 "reasoning": "키워드 기반 문서 검색 분류"
             }
-        elif any(keyword in message_lower for keyword in ['직원', '사원', '성과', '출근', '부서']):
+        elif "analyze_employee_data" in hits:
             return {
                 "intent": "analyze_employee_data",
                 "confidence": 0.7,
@@ -321,7 +399,7 @@ class EnhancedRouterAgent:
                 },
                 "reasoning": "키워드 기반 직원 분석 분류"
             }
-        elif any(keyword in message_lower for keyword in ['고객', '거래처', '매출', '계약']):
+        elif "get_client_information" in hits:
             return {
                 "intent": "get_client_information",
                 "confidence": 0.7,
@@ -347,41 +425,32 @@ class EnhancedRouterAgent:
     def _calculate_confidence(self, message: str, function_name: str) -> float:
         """신뢰도 계산"""
         # 간단한 키워드 매칭 기반 신뢰도
-        keyword_mapping = {
-            "search_documents": ['문서', '정책', '규정', '윤리', '강령', '복리후생'],
-            "analyze_employee_data": ['직원', '사원', '성과', '출근', '부서'],
-            "get_client_information": ['고객', '거래처', '매출', '계약'],
-            "general_conversation": ['안녕', '반갑', '좋은', '회사']
-        }
-        
-        keywords = keyword_mapping.get(function_name, [])
-        message_lower = message.lower()
-        
-        matches = sum(1 for keyword in keywords if keyword in message_lower)
+        matches = len(self._scan_keywords(message).get(function_name, ()))
         base_confidence = 0.9  # GPT-4o 사용시 높은 기본 신뢰도
         
         return min(base_confidence + (matches * 0.05), 0.99)
     
     def _get_service_name(self, function_name: str) -> str:
         """함수 이름을 서비스 이름으로 변환"""
-        mapping = {
-            "search_documents": "document_agent",
-            "analyze_employee_data": "employee_agent",
-            "get_client_information": "client_agent", 
-            "general_conversation": "general_agent"
-        }
-        return mapping.get(function_name, "general_agent")
+        return FUNCTION_TO_SERVICE.get(function_name, "general_agent")
 
 
 # 글로벌 라우터 인스턴스
 enhanced_router = EnhancedRouterAgent()
 
 
+@app.on_event("shutdown")
+async def shutdown_openai_client():
+    """공유 OpenAI 클라이언트 커넥션 정리"""
+    if enhanced_router.openai_client:
+        await enhanced_router.openai_client.close()
+
+
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_message(request: AnalyzeRequest):
     """메시지 의도 분석 (GPT-4o 기반)"""
     try:
-        logger.info(f"GPT-4o 기반 메시지 분석: {request.message}")
+        logger.info("GPT-4o 기반 메시지 분석: %s", request.message)
         
         # GPT-4o를 사용한 라우팅
         result = await enhanced_router.route_with_gpt4o(
@@ -399,7 +468,7 @@ async def analyze_message(request: AnalyzeRequest):
             details=result.get('openai_response')
         )
         
-        logger.info(f"분석 완료: {result['intent']} (신뢰도: {result['confidence']})")
+        logger.info("분석 완료: %s (신뢰도: %s)", result['intent'], result['confidence'])
         return response
         
     except Exception as e:
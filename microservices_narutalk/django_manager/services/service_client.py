@@ -2,6 +2,7 @@
 마이크로서비스 간 통신을 관리하는 서비스 클라이언트
 """
 import httpx
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from django.conf import settings
@@ -15,11 +16,13 @@ class ServiceClient:
     def __init__(self):
         self.services = settings.MICROSERVICES
         self.timeout = 30
+        self.health_check_timeout = 5  # 헬스 체크는 짧게 (느린 서비스 하나가 전체를 붙잡지 않도록)
         self.retry_count = 3
     
     async def call_service(self, service_name: str, endpoint: str, 
-                          method: str = 'GET', data: Optional[Dict] = None) -> Dict[str, Any]:
-        """서비스 호출"""
+                          method: str = 'GET', data: Optional[Dict] = None,
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
+        """서비스 호출 (timeout 미지정 시 기본 timeout 사용)"""
         if service_name not in self.services:
             return {"error": f"Unknown service: {service_name}"}
         
@@ -27,7 +30,7 @@ class ServiceClient:
         url = f"{service_config['URL']}{endpoint}"
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=timeout or self.timeout) as client:
                 if method.upper() == 'GET':
                     response = await client.get(url, params=data)
                 elif method.upper() == 'POST':
@@ -60,14 +63,18 @@ class ServiceClient:
         service_config = self.services[service_name]
         endpoint = service_config['HEALTH_CHECK']
         
-        return await self.call_service(service_name, endpoint, 'GET')
+        return await self.call_service(service_name, endpoint, 'GET',
+                                       timeout=self.health_check_timeout)
     
     async def health_check_all(self) -> Dict[str, Any]:
-        """모든 서비스 헬스 체크"""
-        results = {}
+        """모든 서비스 헬스 체크 (서비스별 호출을 동시에 수행)"""
+        service_names = list(self.services)
+        health_results = await asyncio.gather(
+            *(self.health_check(service_name) for service_name in service_names)
+        )
         
-        for service_name in self.services:
-            result = await self.health_check(service_name)
+        results = {}
+        for service_name, result in zip(service_names, health_results):
             results[service_name] = {
                 "status": "healthy" if "error" not in result else "unhealthy",
                 "details": result
@@ -20,6 +20,27 @@ from .service_client import service_client
 logger = logging.getLogger(__name__)
 
 
+# 의도(intent) → 서비스 호출 핸들러 (args, 원본 메시지를 받아 코루틴 반환)
+INTENT_HANDLERS = {
+    'search_documents': lambda args, message: service_client.search_documents(
+        args.get('query', message),
+        args.get('top_k', 5)
+    ),
+    'analyze_employee_data': lambda args, message: service_client.analyze_employee(
+        args.get('employee_id'),
+        args.get('analysis_type', 'general')
+    ),
+    'get_client_information': lambda args, message: service_client.get_client_info(
+        args.get('client_id'),
+        args.get('info_type', 'basic')
+    ),
+    'general_conversation': lambda args, message: service_client.general_chat(
+        args.get('message', message),
+        args.get('context')
+    ),
+}
+
+
 def async_view(func):
     """비동기 뷰 데코레이터"""
     def wrapper(request, *args, **kwargs):
@@ -42,7 +63,7 @@ class ChatAPIView(View):
                 return JsonResponse({'error': 'Message is required'}, status=400)
             
             # 1. 고도화된 라우터 에이전트에서 의도 분석 (GPT-4o 기반)
-            logger.info(f"Processing message with GPT-4o router: {message}")
+            logger.info("Processing message with GPT-4o router: %s", message)
             intent_result = await service_client.analyze_intent(message)
             
             if 'error' in intent_result:
@@ -56,34 +77,13 @@ class ChatAPIView(View):
             function_call = intent_result.get('function_call', {})
             reasoning = intent_result.get('reasoning', 'AI 분석 결과')
             
-            logger.info(f"GPT-4o Analysis - Intent: {intent}, Confidence: {confidence}, Service: {service_name}")
-            logger.info(f"Reasoning: {reasoning}")
+            logger.info("GPT-4o Analysis - Intent: %s, Confidence: %s, Service: %s", intent, confidence, service_name)
+            logger.info("Reasoning: %s", reasoning)
             
-            # 3. Function Call 기반 서비스 호출
-            if intent == 'search_documents':
-                args = function_call.get('arguments', {})
-                result = await service_client.search_documents(
-                    args.get('query', message), 
-                    args.get('top_k', 5)
-                )
-            elif intent == 'analyze_employee_data':
-                args = function_call.get('arguments', {})
-                result = await service_client.analyze_employee(
-                    args.get('employee_id'),
-                    args.get('analysis_type', 'general')
-                )
-            elif intent == 'get_client_information':
-                args = function_call.get('arguments', {})
-                result = await service_client.get_client_info(
-                    args.get('client_id'),
-                    args.get('info_type', 'basic')
-                )
-            else:  # general_conversation
-                args = function_call.get('arguments', {})
-                result = await service_client.general_chat(
-                    args.get('message', message),
-                    args.get('context')
-                )
+            # 3. Function Call 기반 서비스 호출 (알 수 없는 의도는 일반 대화로 처리)
+            args = function_call.get('arguments', {})
+            handler = INTENT_HANDLERS.get(intent, INTENT_HANDLERS['general_conversation'])
+            result = await handler(args, message)
             
             # 4. 응답 생성
             response_data = {
@@ -101,7 +101,9 @@ class ChatAPIView(View):
             if 'error' in result:
                 response_data['error'] = result['error']
             
-            logger.info(f"Response: {response_data}")
+            # 응답 dict 전체를 문자열화하는 비용은 INFO 로깅이 켜져 있을 때만 지불
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Response: %s", response_data)
             return JsonResponse(response_data)
             
         except json.JSONDecodeError:
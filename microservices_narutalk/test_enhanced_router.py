@@ -35,7 +35,10 @@ TEST_MESSAGES = [
             "우리 회사 직원들의 성과는 어떤가요?",
             "부서별 출근 현황을 분석해주세요",
             "직원 통계 데이터를 보여주세요",
-            "인사 평가 결과를 알려주세요"
+            "인사 평가 결과를 알려주세요",
+            # 겹치는 키워드 ('회사' + '사원') 회귀 케이스
+            "회사원 목록 보여줘",
+            "좋은제약 회사원 몇 명?"
         ]
     },
     {
@@ -58,6 +61,30 @@ TEST_MESSAGES = [
     }
 ]
 
+# 겹치는 키워드 회귀 케이스 ('회사' + '사원' → 직원분석)
+OVERLAP_TEST_MESSAGES = [
+    "회사원 목록 보여줘",
+    "회사원 정보",
+    "좋은제약 회사원 몇 명?"
+]
+
+
+def test_overlapping_keyword_routing():
+    """겹치는 키워드 폴백 라우팅 검증 (서버/OpenAI 없이 직접 호출)"""
+    from agents.router_agent.enhanced_main import enhanced_router, scan_keywords
+    
+    hits = scan_keywords("회사원 목록")
+    assert hits.get("analyze_employee_data") == frozenset({"사원"}), hits
+    assert hits.get("general_conversation") == frozenset({"회사"}), hits
+    
+    for message in OVERLAP_TEST_MESSAGES:
+        result = enhanced_router._fallback_routing(message)
+        assert result["intent"] == "analyze_employee_data", (message, result["intent"])
+    
+    confidence = enhanced_router._calculate_confidence("회사원 목록 보여줘", "analyze_employee_data")
+    assert abs(confidence - 0.95) < 1e-9, confidence
+
+
 class RouterTester:
     def __init__(self):
         self.results = []
@@ -150,6 +177,11 @@ class RouterTester:
         print("🚀 고도화된 라우터 에이전트 테스트 시작")
         print("=" * 60)
         
+        # 0. 폴백 라우팅 회귀 검증 (서버 불필요)
+        print("\n0. 겹치는 키워드 폴백 라우팅 검증")
+        test_overlapping_keyword_routing()
+        print("✅ 겹치는 키워드 메시지가 직원분석 에이전트로 라우팅됩니다.")
+        
         # 1. 헬스 체크
         print("\n1. 라우터 에이전트 헬스 체크")
         if not await self.test_router_health():